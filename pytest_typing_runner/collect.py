@@ -1,11 +1,17 @@
+from __future__ import annotations
+
 import pathlib
-from collections.abc import Iterator
+from collections.abc import Generator, Iterator
+from typing import TYPE_CHECKING
 
 import pytest
 from _pytest.config.argparsing import Parser
 
 from . import protocols, scenarios, strategies
 
+if TYPE_CHECKING:
+    import pluggy
+
 
 @pytest.fixture
 def typing_runner_config(pytestconfig: pytest.Config) -> protocols.RunnerConfig:
@@ -77,16 +83,33 @@ def typing_scenario_runner(
         assert len(failures) == 0, failures
 
 
-def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(
+    item: pytest.Item,
+) -> Generator[None, pluggy.Result[pytest.TestReport], None]:
     """
     For failed tests, we add information to the pytest report from any Scenario objects
     that were added to the pytest report
+
+    When running in a pytest-xdist worker those objects are then removed from
+    the report so that only the already rendered sections are sent to the
+    controller.
     """
+    outcome = yield
+    report = outcome.get_result()
+
     if report.when == "call" and report.outcome == "failed":
         for name, val in report.user_properties:
             if callable(add_to_pytest_report := getattr(val, "add_to_pytest_report", None)):
                 add_to_pytest_report(name, report.sections)
 
+    if hasattr(item.config, "workerinput"):
+        report.user_properties = [
+            (name, val)
+            for name, val in report.user_properties
+            if not callable(getattr(val, "add_to_pytest_report", None))
+        ]
+
 
 def pytest_addoption(parser: Parser) -> None:
     """
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import dataclasses
 import itertools
 from collections.abc import Iterator, Sequence
@@ -16,7 +18,7 @@ class NoticesAreDifferent(errors.PyTestTypingRunnerException, AssertionError):
         return self.difference
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class RunResult:
     """
     Holds the result from running a type checker
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import dataclasses
 import enum
 import functools
@@ -11,6 +13,11 @@ from .. import notice_changers, notices, protocols
 from . import errors as parse_errors
 from . import protocols as parse_protocols
 
+# Severities are immutable so the same instance can be shared by every match
+_NOTE_SEVERITY = notices.NoteSeverity()
+_WARNING_SEVERITY = notices.WarningSeverity()
+_EMPTY_ERROR_SEVERITY = notices.ErrorSeverity("")
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class _ParsedLineBefore:
@@ -34,6 +41,10 @@ class _ParsedLineAfter:
     modify_lines: parse_protocols.ModifyParsedLineBefore | None
 
 
+# Most lines have no instructions, so they all share the same immutable result
+_NO_MATCH_AFTER = _ParsedLineAfter(modify_lines=None, notice_changers=(), names=(), real_line=True)
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CommentMatch:
     """
@@ -159,7 +170,7 @@ class InlineCommentMatch(CommentMatch):
                 continue
 
             gd = m.groupdict()
-            instruction = cls._Instruction(gd["instruction"])
+            instruction = cls._Instruction[gd["instruction"]]
             rest = gd["rest"].strip()
             error_type = ""
 
@@ -189,7 +200,7 @@ class InlineCommentMatch(CommentMatch):
                         names=[],
                         is_note=True,
                         is_whole_line=False,
-                        severity=notices.NoteSeverity(),
+                        severity=_NOTE_SEVERITY,
                         msg=msg,
                     )
                 case cls._Instruction.W:
@@ -197,7 +208,7 @@ class InlineCommentMatch(CommentMatch):
                         names=[],
                         is_warning=True,
                         is_whole_line=False,
-                        severity=notices.WarningSeverity(),
+                        severity=_WARNING_SEVERITY,
                         msg=msg,
                     )
                 case _:
@@ -335,7 +346,7 @@ class InstructionMatch(CommentMatch):
 
         gd = m.groupdict()
         prefix_whitespace = gd["prefix_whitespace"]
-        instruction = cls._Instruction(gd["instruction"])
+        instruction = cls._Instruction[gd["instruction"]]
         error_type = (gd.get("error_type", "") or "").strip()
         names = [name] if (name := gd.get("name", "") or "") else []
         rest = gd["rest"].strip()
@@ -369,14 +380,14 @@ class InstructionMatch(CommentMatch):
 
         match instruction:
             case cls._Instruction.NAME:
-                yield cls(names=names, severity=notices.NoteSeverity(), is_whole_line=True)
+                yield cls(names=names, severity=_NOTE_SEVERITY, is_whole_line=True)
             case cls._Instruction.REVEAL:
                 yield cls(
                     names=names,
                     is_reveal=True,
                     is_note=True,
                     is_whole_line=True,
-                    severity=notices.NoteSeverity(),
+                    severity=_NOTE_SEVERITY,
                     msg=msg,
                     modify_lines=functools.partial(
                         cls._modify_for_reveal, prefix_whitespace=prefix_whitespace
@@ -395,7 +406,7 @@ class InstructionMatch(CommentMatch):
                     names=names,
                     is_warning=True,
                     is_whole_line=True,
-                    severity=notices.WarningSeverity(),
+                    severity=_WARNING_SEVERITY,
                     msg=msg,
                 )
             case cls._Instruction.NOTE:
@@ -403,7 +414,7 @@ class InstructionMatch(CommentMatch):
                     names=names,
                     is_note=True,
                     is_whole_line=True,
-                    severity=notices.NoteSeverity(),
+                    severity=_NOTE_SEVERITY,
                     msg=msg,
                 )
             case _:
@@ -447,9 +458,7 @@ class InstructionParser:
         line = before.lines[-1]
         matches = list(self.parser(line, msg_maker_map=msg_maker_map))
         if not any(matches):
-            return _ParsedLineAfter(
-                modify_lines=None, notice_changers=[], names=[], real_line=True
-            )
+            return _NO_MATCH_AFTER
 
         names: list[str] = []
         changers: list[protocols.LineNoticesChanger] = []
@@ -495,13 +504,13 @@ class InstructionParser:
                     nonlocal skip
                     if skip:
                         return False
-                    if notice.severity == notices.ErrorSeverity("") or notice.is_type_reveal:
+                    if notice.severity == _EMPTY_ERROR_SEVERITY or notice.is_type_reveal:
                         skip = True
                         return False
                     if not notice.msg.is_plain:
                         skip = True
                         return False
-                    return notice.severity == notices.NoteSeverity()
+                    return notice.severity == _NOTE_SEVERITY
 
                 changers.append(
                     notice_changers.ModifyLatestMatch(
@@ -519,9 +528,7 @@ class InstructionParser:
                 changers.append(
                     notice_changers.AppendToLine(
                         notices_maker=lambda line_notices: [
-                            line_notices.generate_notice(
-                                severity=notices.NoteSeverity(), msg=match.msg
-                            )
+                            line_notices.generate_notice(severity=_NOTE_SEVERITY, msg=match.msg)
                         ]
                     )
                 )
@@ -1072,7 +1072,7 @@ if TYPE_CHECKING:
     P_ProgramNotices = ProgramNotices
     P_FileNoticesParser = FileNoticesParser
     P_FileNoticesChanger = FileNoticesChanger
-    P_LineNoticesChanger = FileNoticesChanger
+    P_LineNoticesChanger = LineNoticesChanger
     P_ProgramNoticeChanger = ProgramNoticeChanger
     P_ProgramNoticesChanger = ProgramNoticesChanger
 
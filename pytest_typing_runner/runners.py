@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 import contextlib
 import dataclasses
 import functools
-import importlib
+import importlib.metadata
 import io
 import os
 import pathlib
@@ -17,6 +19,21 @@ from typing_extensions import Self, Unpack
 from . import expectations, parse, protocols
 
 
+@functools.cache
+def _mypy_older_than_1_8() -> bool:
+    """
+    Determine if installed version of mypy is older than 1.8.0
+
+    Cached because the installed version does not change during a test run
+    """
+    version = importlib.metadata.version("mypy")
+    m = re.match(r"^1\.(\d+)\.\d+.*", version)
+    if m is None:
+        return False
+
+    return int(m.groups()[0]) < 8
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class RunOptions(Generic[protocols.T_Scenario]):
     """
@@ -104,10 +121,20 @@ class MypyChecker(Generic[protocols.T_Scenario]):
     runner: protocols.ProgramRunner[protocols.T_Scenario]
     run_options: protocols.RunOptions[protocols.T_Scenario]
 
+    def _stdout_lines(self) -> list[str]:
+        """
+        Return the lines from stdout without any ":debug:" lines
+        """
+        stdout = self.result.stdout
+        lines = stdout.strip().split("\n")
+        if ":debug:" in stdout:
+            lines = [line for line in lines if not line.startswith(":debug:")]
+        return lines
+
     def _check_lines(self, lines: list[str], expected_notices: protocols.ProgramNotices) -> None:
         options = self.run_options
         got = parse.MypyOutput.parse(
-            [l.strip() for l in lines if l.strip()],
+            [stripped for l in lines if (stripped := l.strip())],
             into=options.scenario_runner.generate_program_notices(),
             normalise=functools.partial(
                 options.scenario_runner.normalise_program_runner_notice,
@@ -124,11 +151,8 @@ class MypyChecker(Generic[protocols.T_Scenario]):
         Will ignore any lines that start with ":debug:" and also ignore
         the last line that explains if it found errors or not.
         """
-        lines: list[str] = [
-            line
-            for line in self.result.stdout.strip().split("\n")
-            if not line.startswith(":debug:")
-        ]
+        lines = self._stdout_lines()
+
         if lines[-1].startswith("Found "):
             lines.pop()
 
@@ -162,12 +186,20 @@ class ExternalMypyRunner(Generic[protocols.T_Scenario]):
         """
         return " ".join(self.command)
 
-    def _combine_env(self, overrides: Mapping[str, str | None]) -> Mapping[str, str]:
-        env = dict(os.environ)
+    def _combine_env(self, overrides: Mapping[str, str | None]) -> Mapping[str, str] | None:
+        """
+        Return the environment for the subprocess
+
+        Returns ``None`` when there are no overrides so the subprocess
+        inherits the current environment without making a copy of it.
+        """
+        if not overrides:
+            return None
+
+        env = os.environ.copy()
         for k, v in overrides.items():
             if v is None:
-                if k in env:
-                    del env[k]
+                env.pop(k, None)
             else:
                 env[k] = v
         return env
@@ -178,23 +210,25 @@ class ExternalMypyRunner(Generic[protocols.T_Scenario]):
         """
         Run mypy as an external process.
         """
-        options = self.options
-        env = self._combine_env(options.environment_overrides)
+        return checker_kls(runner=self, run_options=self.options, result=self._run())
 
+    def _run(self) -> expectations.RunResult:
+        """
+        Run the command with our options and return the result
+        """
+        options = self.options
         completed = subprocess.run(
             [*self.command, *options.args, *options.check_paths],
             capture_output=True,
+            encoding="utf-8",
+            errors="replace",
             cwd=options.cwd,
-            env=env,
+            env=self._combine_env(options.environment_overrides),
         )
-        return checker_kls(
-            runner=self,
-            run_options=options,
-            result=expectations.RunResult(
-                exit_code=completed.returncode,
-                stdout=completed.stdout.decode(),
-                stderr=completed.stderr.decode(),
-            ),
+        return expectations.RunResult(
+            exit_code=completed.returncode,
+            stdout=completed.stdout,
+            stderr=completed.stderr,
         )
 
 
@@ -221,15 +255,22 @@ class SameProcessMypyRunner(Generic[protocols.T_Scenario]):
 
         options = self.options
 
+        # Import mypy before saving sys.modules so it stays loaded between runs
+        for name in ("mypy.build", "mypy.fscache", "mypy.main", "mypy.util"):
+            importlib.import_module(name)
+
         @contextlib.contextmanager
         def saved_sys() -> Iterator[None]:
+            # Restore in place, the import system keeps its own reference
+            # to these objects rather than looking them up on sys
             previous_path = list(sys.path)
-            previous_modules = sys.modules.copy()
+            previous_modules = frozenset(sys.modules)
             try:
                 yield
             finally:
-                sys.path = previous_path
-                sys.modules = previous_modules
+                sys.path[:] = previous_path
+                for name in [name for name in sys.modules if name not in previous_modules]:
+                    del sys.modules[name]
 
         exit_code = -1
         with saved_sys(), pytest.MonkeyPatch().context() as monkey_patch:
@@ -269,12 +310,7 @@ class SameProcessMypyRunner(Generic[protocols.T_Scenario]):
         """
         Determine if installed version of mypy is older than 1.8.0
         """
-        version = importlib.metadata.version("mypy")
-        m = re.match("^1\.(\d+)\.\d+.*", version)
-        if m is None:
-            return False
-
-        return int(m.groups()[0]) < 8
+        return _mypy_older_than_1_8()
 
     def _run_inprocess(
         self, options: protocols.RunOptions[protocols.T_Scenario], stdout: TextIO, stderr: TextIO
@@ -285,7 +321,7 @@ class SameProcessMypyRunner(Generic[protocols.T_Scenario]):
 
         fscache = FileSystemCache()
         mypy_sources, mypy_options = process_options(
-            list([*options.args, *options.check_paths]), fscache=fscache
+            [*options.args, *options.check_paths], fscache=fscache
         )
 
         messages: list[str] = []
@@ -359,11 +395,8 @@ class DaemonMypyChecker(MypyChecker[protocols.T_Scenario]):
         and check the existence or absence of these messages against
         ``scenario.expects.daemon_restarted``.
         """
-        lines: list[str] = [
-            line
-            for line in self.result.stdout.strip().split("\n")
-            if not line.startswith(":debug:")
-        ]
+        lines = self._stdout_lines()
+
         if lines[-1].startswith("Found "):
             lines.pop()
 
@@ -429,37 +462,41 @@ class ExternalDaemonMypyRunner(ExternalMypyRunner[protocols.T_Scenario]):
                 env=self._combine_env(self.options.environment_overrides),
             ),
         )
-        checker = super().run(checker_kls=checker_kls)
-        lines = checker.result.stdout.strip().split("\n")
+        result = self._run()
 
         # dmypy can return exit_code=1 even if it was successful
-        exit_code = checker.result.exit_code
-        if lines and lines[-1].startswith("Success: no issues found"):
-            exit_code = 0
-
-        return checker_kls(
-            runner=self,
-            run_options=checker.run_options,
-            result=expectations.RunResult(
-                exit_code=exit_code, stdout=checker.result.stdout, stderr=checker.result.stderr
-            ),
-        )
+        if result.exit_code != 0:
+            last_line = result.stdout.strip().rsplit("\n", 1)[-1]
+            if last_line.startswith("Success: no issues found"):
+                result = dataclasses.replace(result, exit_code=0)
 
-    def _cleanup(self, *, cwd: pathlib.Path, env: Mapping[str, str]) -> None:
+        return checker_kls(runner=self, run_options=self.options, result=result)
+
+    def _cleanup(self, *, cwd: pathlib.Path, env: Mapping[str, str] | None) -> None:
         """
         If dmypy is running in the cwd that was used then make sure to make it
         stop.
         """
         completed = subprocess.run(
-            [*self.command, "status"], capture_output=True, cwd=cwd, env=env
+            [*self.command, "status"],
+            capture_output=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=cwd,
+            env=env,
         )
         if completed.returncode == 0:
             completed = subprocess.run(
-                [*self.command, "kill"], capture_output=True, cwd=cwd, env=env
+                [*self.command, "kill"],
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                cwd=cwd,
+                env=env,
             )
             assert (
                 completed.returncode == 0
-            ), f"Failed to stop dmypy: {completed.returncode}\n{completed.stdout.decode()}\n{completed.stderr.decode()}"
+            ), f"Failed to stop dmypy: {completed.returncode}\n{completed.stdout}\n{completed.stderr}"
 
 
 if TYPE_CHECKING:
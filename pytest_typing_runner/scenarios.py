@@ -261,6 +261,17 @@ class ScenarioRuns(Generic[protocols.T_Scenario]):
         return run
 
 
+def _is_outside_root(path: pathlib.PurePath) -> bool:
+    """
+    Return whether this path may point outside the directory it is joined to
+
+    Checks the anchor rather than ``is_absolute()`` because on Windows a path
+    with only a root (``/one``) or only a drive (``C:one``) is not absolute
+    but still replaces part of the directory it is joined to.
+    """
+    return bool(path.anchor) or ".." in path.parts
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ScenarioRunner(Generic[protocols.T_Scenario]):
     """
@@ -343,17 +354,24 @@ class ScenarioRunner(Generic[protocols.T_Scenario]):
         There are :ref:`helpers for changing files <file_changer>` that can be
         used to perform high level changes with this hook.
 
-        :param path: The string path relative to ``root_dir`` to change
+        :param path:
+            The string path relative to ``root_dir`` to change. Paths with a
+            root or drive (for example ``/one``, ``C:\\one`` or ``C:one``) and
+            paths with any ``..`` component are refused, even when they would
+            resolve to somewhere inside ``root_dir``.
         :param content:
             Either a string to replace the whole file, or ``None`` if the file
             should be deleted.
+        :raises ValueError: If the path is refused
         """
-        location = self.scenario.root_dir / path
-        if not location.is_relative_to(self.scenario.root_dir):
+        if _is_outside_root(pathlib.PurePath(path)):
             raise ValueError("Tried to modify a file outside of the test root")
 
+        location = self.scenario.root_dir / path
+        new_content = None if content is None else textwrap.dedent(content)
+
         if location.exists():
-            if content is None:
+            if new_content is None:
                 action = "delete"
                 if location.is_dir():
                     shutil.rmtree(location)
@@ -361,17 +379,16 @@ class ScenarioRunner(Generic[protocols.T_Scenario]):
                     location.unlink()
             else:
                 action = "change"
-                new_content = textwrap.dedent(content)
                 if location.read_text() == new_content:
                     return
                 location.write_text(new_content)
         else:
-            if content is None:
+            if new_content is None:
                 action = "already_deleted"
             else:
                 action = "create"
                 location.parent.mkdir(parents=True, exist_ok=True)
-                location.write_text(textwrap.dedent(content))
+                location.write_text(new_content)
 
         self.runs.add_file_modification(path, action)
 
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import argparse
 import dataclasses
 import importlib.metadata
@@ -17,7 +19,7 @@ class NoStrategiesRegistered(errors.PyTestTypingRunnerException):
     """
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Strategy:
     """
     Represents how to get to the program runner for the test
@@ -119,7 +121,7 @@ class StrategyRegistry:
         """
         return sorted(self.registry)
 
-    @dataclasses.dataclass(frozen=True, kw_only=True)
+    @dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
     class CLIOptions:
         """
         Options returned from the function that creates information required
@@ -149,24 +151,24 @@ class StrategyRegistry:
                 )
             return got[1]()
 
+        choices = self.choices
+        default = self.default
+
         help_text: list[str] = ["The caching strategy used by the plugin"]
-        for name in self.choices:
+        for name in choices:
             got = self.get_strategy(name=name)
             if got is None:
                 continue
             description, _ = got
             help_text.append("")
-            help_text.append(name)
-            if name == self.default:
-                help_text[-1] = f"{help_text[-1]} (default)"
-            for line in description.split("\n"):
-                help_text.append(f"    {line}")
+            help_text.append(f"{name} (default)" if name == default else name)
+            help_text.extend(f"    {line}" for line in description.split("\n"))
 
         return self.CLIOptions(
             str_to_strategy=str_to_strategy,
             help_text="\n".join(help_text),
-            default=self.default,
-            choices=self.choices,
+            default=default,
+            choices=choices,
         )
 
 
@@ -437,8 +437,8 @@ class TestInstructionParser:
 
         after = parse.file_content.InstructionParser(parser=parser).parse(before)
         assert after.modify_lines is None
-        assert after.notice_changers == []
-        assert after.names == []
+        assert after.notice_changers == ()
+        assert after.names == ()
         assert after.real_line
 
     @pytest.mark.parametrize("match", example_comment_matches)
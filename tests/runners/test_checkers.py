@@ -131,6 +131,37 @@ class TestMypyChecker:
             """).strip()
         )
 
+    def test_it_ignores_debug_lines(
+        self, tmp_path: pathlib.Path, checker_maker: NoticeCheckerMaker
+    ) -> None:
+        config = stubs.StubRunnerConfig()
+        runner = scenarios.ScenarioRunner[protocols.Scenario].create(
+            config=config,
+            root_dir=tmp_path,
+            scenario_maker=scenarios.Scenario.create,
+            scenario_runs_maker=scenarios.ScenarioRuns.create,
+        )
+        options = runners.RunOptions.create(runner)
+        program_runner = options.program_runner_maker(options=options)
+
+        result = stubs.StubRunResult(
+            exit_code=0,
+            stdout=textwrap.dedent("""
+            :debug: Checking main.py
+            main.py:3: note: Revealed type is "builtins.int"
+            :debug: Finished main.py
+            Success: no issues found in 2 source files
+        """).strip(),
+        )
+
+        checker = checker_maker(result=result, run_options=options, runner=program_runner)
+
+        expected_notices = notice_changers.BulkAdd(
+            root_dir=tmp_path,
+            add={"main.py": {3: [notices.ProgramNotice.reveal_msg("builtins.int")]}},
+        )(runner.generate_program_notices())
+        checker.check(expected_notices)
+
 
 class TestDMypyChecker:
     @pytest.fixture
@@ -147,6 +178,11 @@ class TestDMypyChecker:
     ) -> None:
         TestMypyChecker().test_it_can_check_error_mypy_result(tmp_path, checker_maker)
 
+    def test_it_ignores_debug_lines(
+        self, tmp_path: pathlib.Path, checker_maker: NoticeCheckerMaker
+    ) -> None:
+        TestMypyChecker().test_it_ignores_debug_lines(tmp_path, checker_maker)
+
     def test_it_tests_if_daemon_restarted_or_not(
         self, tmp_path: pathlib.Path, checker_maker: NoticeCheckerMaker
     ) -> None:
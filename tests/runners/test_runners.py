@@ -57,6 +57,24 @@ class TestExternalMypyRunner:
         assert mypy_runner.command == (sys.executable, "-m", "mypy")
         assert mypy_runner.short_display() == " ".join(mypy_runner.command)
 
+    def test_it_only_copies_the_environment_when_there_are_overrides(
+        self,
+        runner: protocols.ScenarioRunner[protocols.Scenario],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("ONE", "1")
+        monkeypatch.setenv("TWO", "2")
+
+        mypy_runner = runners.ExternalMypyRunner(options=runners.RunOptions.create(runner))
+        assert mypy_runner._combine_env({}) is None
+
+        env = mypy_runner._combine_env({"ONE": None, "THREE": "3", "FOUR": None})
+        assert env is not None
+        assert "ONE" not in env
+        assert "FOUR" not in env
+        assert env["TWO"] == "2"
+        assert env["THREE"] == "3"
+
     def test_it_runs_mypy_and_returns_stdout_stderr_and_exit_code(
         self,
         tmp_path: pathlib.Path,
@@ -95,6 +113,31 @@ class TestExternalMypyRunner:
             == f"{options.cwd}\n--one --for-stderr {stderr_location} --for-stdout {stdout_location} two three"
         )
 
+    def test_it_replaces_output_that_is_not_utf8(
+        self, runner: protocols.ScenarioRunner[protocols.Scenario]
+    ) -> None:
+        def make_parser() -> argparse.ArgumentParser:
+            return argparse.ArgumentParser()
+
+        def mainline(argv: list[str], parser: argparse.ArgumentParser, out: pathlib.Path) -> None:
+            sys.stdout.buffer.write(b"one \xff two\n")
+            sys.stderr.buffer.write(b"three \xfe four\n")
+
+        class BadBytesRunner(runners.ExternalMypyRunner[protocols.Scenario]):
+            mypy_name = "bad_bytes"
+
+        with executable.make_python_module(
+            "bad_bytes", make_parser=make_parser, mainline=mainline
+        ) as (_, pythonpath):
+            options = runners.RunOptions.create(
+                runner, environment_overrides={"PYTHONPATH": pythonpath}
+            )
+            checker = BadBytesRunner(options=options).run()
+
+        assert checker.result.exit_code == 0
+        assert checker.result.stdout == "one \ufffd two\n"
+        assert checker.result.stderr == "three \ufffd four\n"
+
 
 class TestSameProcessMypyRunner:
     def test_it_has_short_display(
@@ -105,6 +148,31 @@ class TestSameProcessMypyRunner:
         mypy_runner = runners.SameProcessMypyRunner(options=options)
         assert mypy_runner.short_display() == "inprocess::mypy"
 
+    def test_it_restores_sys_path_and_modules_in_place(
+        self, runner: protocols.ScenarioRunner[protocols.Scenario]
+    ) -> None:
+        (runner.scenario.root_dir / "main.py").write_text("a: int = 1\n")
+        options = runners.RunOptions.create(runner, args=["--no-incremental"])
+
+        checker = runners.SameProcessMypyRunner(options=options).run()
+        assert checker.result.exit_code == 0
+
+        path = sys.path
+        modules = sys.modules
+        previous_path = list(sys.path)
+        previous_modules = set(sys.modules)
+
+        checker = runners.SameProcessMypyRunner(options=options).run()
+        assert checker.result.exit_code == 0
+
+        assert sys.path is path
+        assert sys.modules is modules
+        assert sys.path == previous_path
+        assert set(sys.modules) - previous_modules == set()
+
+        # mypy is imported before sys.modules is saved and stays loaded
+        assert "mypy.build" in sys.modules
+
 
 class TestExternalDaemonMypyRunner:
     @pytest.fixture
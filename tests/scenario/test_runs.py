@@ -95,6 +95,20 @@ class TestScenarioRun:
         assert scenario_run.expectation_error is None
         assert scenario_run.file_modifications == [("one", "two"), ("three", "four")]
 
+    def test_it_can_be_made_with_a_subscripted_class(
+        self, options: protocols.RunOptions[protocols.Scenario]
+    ) -> None:
+        notice_checker = options.program_runner_maker(options=options).run()
+        scenario_run = scenarios.ScenarioRun[protocols.Scenario](
+            is_first=True,
+            is_followup=False,
+            checker=notice_checker,
+            expectation_error=None,
+            file_modifications=(),
+        )
+
+        assert scenario_run.checker is notice_checker
+
     def test_it_can_hold_an_expectation_error(
         self, options: protocols.RunOptions[protocols.Scenario]
     ) -> None:
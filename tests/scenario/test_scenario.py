@@ -226,6 +226,55 @@ class TestScenarioRunner:
             r3 = runner.runs.add_run(checker=notice_checker, expectation_error=None)
             assert list(r3.file_modifications) == [("two/other", "create")]
 
+        @pytest.mark.parametrize(
+            ("path", "would_write"),
+            [("../one", "../one"), ("two/../../three", "../three"), ("five/../six", "six")],
+        )
+        def test_it_refuses_paths_with_parent_components(
+            self,
+            runner: protocols.ScenarioRunner[protocols.Scenario],
+            path: str,
+            would_write: str,
+        ) -> None:
+            location = (runner.scenario.root_dir / would_write).resolve()
+            with pytest.raises(
+                ValueError, match="Tried to modify a file outside of the test root"
+            ):
+                runner.file_modification(path, "content")
+
+            assert not location.exists()
+
+        def test_it_refuses_absolute_paths(
+            self,
+            runner: protocols.ScenarioRunner[protocols.Scenario],
+            tmp_path_factory: pytest.TempPathFactory,
+        ) -> None:
+            location = tmp_path_factory.mktemp("elsewhere") / "four"
+            with pytest.raises(
+                ValueError, match="Tried to modify a file outside of the test root"
+            ):
+                runner.file_modification(str(location), "content")
+
+            assert not location.exists()
+
+        @pytest.mark.parametrize(
+            ("path", "outside"),
+            [
+                (pathlib.PureWindowsPath("/one"), True),
+                (pathlib.PureWindowsPath("D:one"), True),
+                (pathlib.PureWindowsPath("D:\\one"), True),
+                (pathlib.PureWindowsPath("two\\..\\three"), True),
+                (pathlib.PureWindowsPath("two\\three"), False),
+                (pathlib.PurePosixPath("/one"), True),
+                (pathlib.PurePosixPath("two/../three"), True),
+                (pathlib.PurePosixPath("two/three"), False),
+            ],
+        )
+        def test_it_knows_which_paths_are_outside_the_root(
+            self, path: pathlib.PurePath, outside: bool
+        ) -> None:
+            assert scenarios._is_outside_root(path) is outside
+
         def test_it_performs_a_textwrap(
             self, runner: protocols.ScenarioRunner[protocols.Scenario]
         ) -> None:
@@ -301,3 +301,57 @@ class TestPlugin:
                 assert report.nodeid == (
                     "test_it_adds_a_report_section_for_failed_tests.py::TestOne::test_two"
                 )
+
+    def test_it_only_sends_rendered_report_sections_from_xdist_workers(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        pytester.makeconftest("""
+        from pytest_typing_runner import scenarios, protocols
+        from collections.abc import Iterator
+        import dataclasses
+        import pytest
+
+
+        def pytest_configure(config: pytest.Config) -> None:
+            # pytest-xdist sets this on the config in worker processes
+            config.workerinput = {"workerid": "gw0"}
+
+
+        @dataclasses.dataclass(frozen=True, kw_only=True)
+        class Runs(scenarios.ScenarioRuns):
+            @property
+            def has_runs(self) -> bool:
+                return True
+
+            def for_report(self) -> Iterator[str]:
+                yield "one"
+
+        @pytest.fixture()
+        def typing_scenario_runs_maker() -> protocols.ScenarioRunsMaker[scenarios.Scenario]:
+            return Runs
+        """)
+
+        pytester.makepyfile("""
+        from pytest_typing_runner import scenarios, protocols
+        import pytest
+
+
+        def test_one(typing_scenario_runner: protocols.ScenarioRunner[scenarios.Scenario], record_property) -> None:
+            record_property("other", 1)
+            raise AssertionError("NO")
+        """)
+
+        result = pytester.runpytest()
+        result.assert_outcomes(failed=1)
+
+        reports = [
+            report
+            for report in result.reprec.getreports()  # type: ignore[attr-defined]
+            if isinstance(report, pytest.TestReport)
+        ]
+        assert [report.when for report in reports] == ["setup", "call", "teardown"]
+
+        for report in reports:
+            assert report.user_properties == ([] if report.when == "setup" else [("other", 1)])
+            if report.when == "call":
+                assert report.sections == [("typing_runner", "one")]